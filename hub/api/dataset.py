@@ -4,17 +4,29 @@ This Source Code Form is subject to the terms of the Mozilla Public License, v.
 If a copy of the MPL was not distributed with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 """
 
+import asyncio
 import os
 import posixpath
 import collections.abc as abc
+import functools
+import io
+import itertools
 import json
+import struct
 import sys
 import traceback
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from PIL import Image as im, ImageChops
 
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
 import fsspec
+from fsspec.asyn import AsyncFileSystem, sync
 from fsspec.spec import AbstractFileSystem
 import numcodecs
 import numcodecs.lz4
@@ -31,15 +43,17 @@ from hub.schema.features import (
 from hub.log import logger
 import hub.store.pickle_s3_storage
 
-from hub.api.datasetview import DatasetView
+from hub.api.datasetview import DatasetView, _PrefetchedView
 from hub.api.objectview import ObjectView
 from hub.api.tensorview import TensorView
 from hub.api.dataset_utils import (
     create_numpy_dict,
     get_value,
+    read_bulk,
     slice_split,
     str_to_int,
     _copy_helper,
+    _needs_per_sample,
 )
 
 import hub.schema.serialize
@@ -65,7 +79,15 @@ from hub.client.hub_control import HubControlClient
 from hub.schema import Audio, BBox, ClassLabel, Image, Sequence, Text, Video
 from hub.numcodecs import PngCodec
 
-from hub.utils import norm_cache, norm_shape, _tuple_product
+from hub.utils import (
+    norm_cache,
+    norm_shape,
+    _tuple_product,
+    _json_dumps,
+    _json_loads,
+    _get_io_executor,
+    _get_io_parallelism,
+)
 from hub import defaults
 
 
@@ -73,6 +95,218 @@ def get_file_count(fs: fsspec.AbstractFileSystem, path):
     return len(fs.listdir(path, detail=False))
 
 
+def _refresh_listing(fs: fsspec.AbstractFileSystem, path):
+    try:
+        # Update boto3 cache
+        fs.ls(path, detail=False, refresh=True)
+    except Exception:
+        pass
+
+
+def _get_iter_prefetch():
+    return int(os.environ.get("HUB_ITER_PREFETCH", defaults.DEFAULT_ITER_PREFETCH))
+
+
+def _is_key_and_index(slice_):
+    """Checks for the common ds["key", index] form, which doesn't need slice_split"""
+    return (
+        type(slice_) is tuple
+        and len(slice_) == 2
+        and isinstance(slice_[0], str)
+        and isinstance(slice_[1], (int, slice))
+    )
+
+
+def _key_to_subpath(key: str) -> str:
+    return key if key.startswith("/") else "/" + key
+
+
+async def _gather(*coroutines):
+    return await asyncio.gather(*coroutines)
+
+
+def _makedirs_all(fs: fsspec.AbstractFileSystem, paths):
+    """Creates all the directories at once, as a single batch of concurrent requests"""
+    if isinstance(fs, AsyncFileSystem) and hasattr(fs, "_makedirs"):
+        sync(fs.loop, _gather, *[fs._makedirs(path) for path in paths])
+    elif len(paths) > 1 and _get_io_parallelism() > 1:
+        list(_get_io_executor().map(fs.makedirs, paths))
+    else:
+        for path in paths:
+            fs.makedirs(path)
+
+
+@functools.lru_cache(maxsize=256)
+def _deserialize_schema(schema_bytes: bytes):
+    """Deserializes the schema stored in meta.json, datasets opened again with the same schema share it"""
+    return hub.schema.deserialize.deserialize(_json_loads(schema_bytes))
+
+
+def _get_compressor(compressor: str):
+    """Codecs keep no state, so a single instance is shared by all the tensors using it"""
+    codec = _get_named_compressor(compressor.lower())
+    if codec is None:
+        raise ValueError(
+            f"Wrong compressor: {compressor}, only LZ4 and ZSTD are supported"
+        )
+    return codec
+
+
+@functools.lru_cache(maxsize=None)
+def _get_named_compressor(name: str):
+    """Cached on the lowercased name, so every spelling of a compressor shares its codec"""
+    if name == "lz4":
+        return numcodecs.LZ4(numcodecs.lz4.DEFAULT_ACCELERATION)
+    elif name == "zstd":
+        return numcodecs.Zstd(numcodecs.zstd.DEFAULT_CLEVEL)
+    elif name == "default":
+        return "default"
+    elif name == "png":
+        return PngCodec(solo_channel=True)
+    return None
+
+
+_IMG_EXTS = frozenset({".png", ".jpg", ".jpeg", ".tiff", ".bmp"})
+_CV2_EXTS = frozenset({".png", ".jpg", ".jpeg", ".bmp"})
+# Channels of the image modes kept as is, any other mode is stored as one channel
+_MODE_CH = {"RGB": 3, "RGBA": 4, "LA": 2}
+_PNG_MODES = {0: "L", 2: "RGB", 3: "P", 4: "LA", 6: "RGBA"}
+_JPEG_MODES = {1: "L", 3: "RGB", 4: "CMYK"}
+
+
+def _is_8bit_mode(mode: str) -> bool:
+    """Whether PIL decodes the image mode to at most 8 bits per band, integer and float modes don't"""
+    return not mode.startswith(("I", "F"))
+
+
+def _extension(name: str) -> str:
+    """Lowercased extension of a file name, including the dot"""
+    return name[name.rfind(".") :].lower()
+
+
+def _probe_image_header(img_path: str):
+    """Reads (width, height, mode) from the PNG IHDR or JPEG SOF header without going through PIL.
+    Returns None for other formats or headers it can't parse.
+    """
+    with open(img_path, "rb") as f:
+        head = f.read(26)
+        if (
+            head[:8] == b"\x89PNG\r\n\x1a\n"
+            and head[12:16] == b"IHDR"
+            and len(head) == 26
+        ):
+            mode = _PNG_MODES.get(head[25])
+            if mode is None or head[24] != 8:
+                return None
+            width, height = struct.unpack(">II", head[16:24])
+            return width, height, mode
+        if head[:2] != b"\xff\xd8":
+            return None
+        f.seek(2)
+        while True:
+            byte = f.read(1)
+            if not byte:
+                return None
+            if byte != b"\xff":
+                continue
+            marker = f.read(1)
+            while marker == b"\xff":
+                marker = f.read(1)
+            if not marker:
+                return None
+            marker = marker[0]
+            if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+                continue
+            segment = f.read(2)
+            if len(segment) < 2:
+                return None
+            length = struct.unpack(">H", segment)[0]
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                sof = f.read(6)
+                if len(sof) < 6:
+                    return None
+                height, width = struct.unpack(">HH", sof[1:5])
+                mode = _JPEG_MODES.get(sof[5])
+                return (width, height, mode) if mode is not None else None
+            f.seek(length - 2, os.SEEK_CUR)
+
+
+def _image_size_and_mode(img_path: str):
+    """Returns (width, height, mode) of an image, reading only its header when possible"""
+    probed = _probe_image_header(img_path)
+    if probed is not None:
+        return probed
+    with im.open(img_path) as image:
+        return image.size[0], image.size[1], image.mode
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class _ReadAheadSamples:
+    """Sized iterable over the images of each class, yielding (label, path, mode, file bytes).
+    The files are read on the thread pool ahead of the consumer, so disk reads overlap with decoding.
+    """
+
+    def __init__(self, class_images, read_ahead: int):
+        self._class_images = class_images
+        self._read_ahead = read_ahead
+
+    def __len__(self):
+        return sum(len(paths) for _, paths, _ in self._class_images)
+
+    def _samples(self):
+        for label, paths, modes in self._class_images:
+            for path, mode in zip(paths, modes):
+                yield label, path, mode
+
+    def __iter__(self):
+        if self._read_ahead <= 1 or _get_io_parallelism() <= 1:
+            for label, path, mode in self._samples():
+                yield label, path, mode, _read_file(path)
+            return
+        executor = _get_io_executor()
+        pending = deque()
+        for sample in self._samples():
+            pending.append((sample, executor.submit(_read_file, sample[1])))
+            if len(pending) >= self._read_ahead:
+                (label, path, mode), raw = pending.popleft()
+                yield label, path, mode, raw.result()
+        while pending:
+            (label, path, mode), raw = pending.popleft()
+            yield label, path, mode, raw.result()
+
+
+def _decode_image_cv2(raw: bytes, mode: str, size):
+    """Decodes an encoded 8-bit L, RGB or RGBA image with OpenCV and resizes it to size (width, height).
+    Returns None if OpenCV decodes it into anything else, so the caller can fall back to PIL.
+    Resizing goes through PIL like the fallback does, cv2.resize rounds differently and doesn't
+    premultiply alpha, so the stored pixels would depend on whether OpenCV is installed.
+    """
+    read_flags = {
+        "L": cv2.IMREAD_GRAYSCALE,
+        "RGB": cv2.IMREAD_COLOR,
+        "RGBA": cv2.IMREAD_UNCHANGED,
+    }
+    pixels = cv2.imdecode(
+        np.frombuffer(raw, dtype="uint8"),
+        read_flags[mode] | cv2.IMREAD_IGNORE_ORIENTATION,
+    )
+    if pixels is None or pixels.dtype != np.uint8:
+        return None
+    if (pixels.shape[2] if pixels.ndim == 3 else 1) != _MODE_CH.get(mode, 1):
+        return None
+    if mode == "RGB":
+        pixels = cv2.cvtColor(pixels, cv2.COLOR_BGR2RGB)
+    elif mode == "RGBA":
+        pixels = cv2.cvtColor(pixels, cv2.COLOR_BGRA2RGBA)
+    if (pixels.shape[1], pixels.shape[0]) != tuple(size):
+        pixels = np.asarray(im.fromarray(pixels, mode).resize(size, im.BILINEAR))
+    return pixels
+
+
 class Dataset:
     def __init__(
         self,
@@ -157,15 +391,21 @@ class Dataset:
             self._fs, self._path, cache, lock=lock_cache, storage_cache=storage_cache
         )
         self._fs_map = fs_map
+        # last meta.json bytes seen by _save_meta and their parsed value
+        self._meta_bytes = None
+        self._meta_dict = None
+        # serialized meta_info as last stored in meta.json
+        self._meta_info_bytes = None
         self._meta_information = meta_information
         self.username = None
         self.dataset_name = None
         if not needcreate:
-            self.meta = json.loads(fs_map["meta.json"].decode("utf-8"))
+            self.meta = _json_loads(fs_map["meta.json"])
             self._name = self.meta.get("name") or None
             self._shape = tuple(self.meta["shape"])
-            self._schema = hub.schema.deserialize.deserialize(self.meta["schema"])
+            self._schema = _deserialize_schema(_json_dumps(self.meta["schema"]))
             self._meta_information = self.meta.get("meta_info") or dict()
+            self._meta_info_bytes = _json_dumps(self.meta.get("meta_info"))
             self._flat_tensors = tuple(flatten(self._schema))
             self._tensors = dict(self._open_storage_tensors())
             if shape != (None,) and shape != self._shape:
@@ -205,7 +445,8 @@ class Dataset:
                 logger.error("Deleting the dataset " + traceback.format_exc() + str(e))
                 raise
 
-        self.indexes = list(range(self._shape[0]))
+        self._build_key_index()
+        self.indexes = range(self._shape[0])
 
         if self._path.startswith("s3://snark-hub-dev/") or self._path.startswith(
             "s3://snark-hub/"
@@ -266,7 +507,8 @@ class Dataset:
             "name": self._name,
         }
 
-        self._fs_map["meta.json"] = bytes(json.dumps(meta), "utf-8")
+        self._fs_map["meta.json"] = _json_dumps(meta)
+        self._meta_info_bytes = _json_dumps(meta["meta_info"])
         return meta
 
     def _check_and_prepare_dir(self):
@@ -286,12 +528,14 @@ class Dataset:
                 except BaseException:
                     raise WrongUsernameException(stored_username)
         meta_path = posixpath.join(path, "meta.json")
-        try:
-            # Update boto3 cache
-            fs.ls(path, detail=False, refresh=True)
-        except Exception:
-            pass
+        # Only overwriting needs the current state of the directory,
+        # otherwise the listing cache is refreshed only if it doesn't know the dataset
+        if "w" in mode:
+            _refresh_listing(fs, path)
         exist_meta = fs.exists(meta_path)
+        if not exist_meta and "w" not in mode:
+            _refresh_listing(fs, path)
+            exist_meta = fs.exists(meta_path)
         if exist_meta:
             if "w" in mode:
                 fs.rm(path, recursive=True)
@@ -320,63 +564,61 @@ class Dataset:
             return "object"
 
     def _get_compressor(self, compressor: str):
-        if compressor.lower() == "lz4":
-            return numcodecs.LZ4(numcodecs.lz4.DEFAULT_ACCELERATION)
-        elif compressor.lower() == "zstd":
-            return numcodecs.Zstd(numcodecs.zstd.DEFAULT_CLEVEL)
-        elif compressor.lower() == "default":
-            return "default"
-        elif compressor.lower() == "png":
-            return PngCodec(solo_channel=True)
-        else:
-            raise ValueError(
-                f"Wrong compressor: {compressor}, only LZ4 and ZSTD are supported"
+        return _get_compressor(compressor)
+
+    def _prepare_tensor_specs(self):
+        """Computes once per open the storage path and DynamicTensor arguments of each tensor"""
+        root = self._path.rstrip("/")
+        return tuple(
+            (
+                t_path,
+                f"{root}/{t_path.lstrip('/')}",
+                self._get_dynamic_tensor_dtype(t_dtype),
+                t_dtype.chunks,
+                self._get_compressor(t_dtype.compressor),
+                self._shape + t_dtype.shape,
+                self._shape + t_dtype.max_shape,
             )
+            for t_dtype, t_path in self._flat_tensors
+        )
+
+    def _tensor_storage(self, t_path, path, prelisted=None):
+        return MetaStorage(
+            t_path,
+            get_storage_map(
+                self._fs,
+                path,
+                self._cache,
+                self.lock_cache,
+                storage_cache=self._storage_cache,
+                prelisted=prelisted,
+            ),
+            self._fs_map,
+        )
 
     def _generate_storage_tensors(self):
-        for t in self._flat_tensors:
-            t_dtype, t_path = t
-            path = posixpath.join(self._path, t_path[1:])
-            self._fs.makedirs(posixpath.join(path, "--dynamic--"))
+        specs = self._prepare_tensor_specs()
+        # List the dataset once, tensor creation otherwise lists every tensor directory
+        prelisted = self._fs.find(self._path)
+        _makedirs_all(self._fs, [f"{spec[1]}/--dynamic--" for spec in specs])
+        for t_path, path, dtype, chunks, compressor, shape, max_shape in specs:
             yield t_path, DynamicTensor(
-                fs_map=MetaStorage(
-                    t_path,
-                    get_storage_map(
-                        self._fs,
-                        path,
-                        self._cache,
-                        self.lock_cache,
-                        storage_cache=self._storage_cache,
-                    ),
-                    self._fs_map,
-                ),
+                fs_map=self._tensor_storage(t_path, path, prelisted),
                 mode=self._mode,
-                shape=self._shape + t_dtype.shape,
-                max_shape=self._shape + t_dtype.max_shape,
-                dtype=self._get_dynamic_tensor_dtype(t_dtype),
-                chunks=t_dtype.chunks,
-                compressor=self._get_compressor(t_dtype.compressor),
+                shape=shape,
+                max_shape=max_shape,
+                dtype=dtype,
+                chunks=chunks,
+                compressor=compressor,
             )
 
     def _open_storage_tensors(self):
-        for t in self._flat_tensors:
-            t_dtype, t_path = t
-            path = posixpath.join(self._path, t_path[1:])
+        for t_path, path, _, _, _, shape, _ in self._prepare_tensor_specs():
             yield t_path, DynamicTensor(
-                fs_map=MetaStorage(
-                    t_path,
-                    get_storage_map(
-                        self._fs,
-                        path,
-                        self._cache,
-                        self.lock_cache,
-                        storage_cache=self._storage_cache,
-                    ),
-                    self._fs_map,
-                ),
+                fs_map=self._tensor_storage(t_path, path),
                 mode=self._mode,
                 # FIXME We don't need argument below here
-                shape=self._shape + t_dtype.shape,
+                shape=shape,
             )
 
     def __getitem__(self, slice_):
@@ -389,10 +631,13 @@ class Dataset:
         >>> image = images[5]
         >>> return image[0:1920, 0:1080, 0:3].compute()
         """
-        if not isinstance(slice_, abc.Iterable) or isinstance(slice_, str):
-            slice_ = [slice_]
-        slice_ = list(slice_)
-        subpath, slice_list = slice_split(slice_)
+        if _is_key_and_index(slice_):
+            subpath, slice_list = _key_to_subpath(slice_[0]), [slice_[1]]
+        else:
+            if not isinstance(slice_, abc.Iterable) or isinstance(slice_, str):
+                slice_ = [slice_]
+            slice_ = list(slice_)
+            subpath, slice_list = slice_split(slice_)
         if not subpath:
             if len(slice_list) > 1:
                 raise ValueError(
@@ -413,34 +658,32 @@ class Dataset:
                     lazy=self.lazy,
                 )
                 return tensorview if self.lazy else tensorview.compute()
-            for key in self.keys:
-                if subpath.startswith(key):
-                    objectview = ObjectView(
-                        dataset=self,
-                        subpath=subpath,
-                        lazy=self.lazy,
-                        slice_=[slice(0, self._shape[0])],
-                    )
-                    return objectview if self.lazy else objectview.compute()
+            if self._is_inside_tensor(subpath):
+                objectview = ObjectView(
+                    dataset=self,
+                    subpath=subpath,
+                    lazy=self.lazy,
+                    slice_=[slice(0, self._shape[0])],
+                )
+                return objectview if self.lazy else objectview.compute()
             return self._get_dictionary(subpath)
         else:
-            schema_obj = self.schema.dict_[subpath.split("/")[1]]
             if subpath in self.keys and (
-                not isinstance(schema_obj, Sequence) or len(slice_list) <= 1
+                len(slice_list) <= 1
+                or not isinstance(self.schema.dict_[subpath.split("/")[1]], Sequence)
             ):
                 tensorview = TensorView(
                     dataset=self, subpath=subpath, slice_=slice_list, lazy=self.lazy
                 )
                 return tensorview if self.lazy else tensorview.compute()
-            for key in self.keys:
-                if subpath.startswith(key):
-                    objectview = ObjectView(
-                        dataset=self,
-                        subpath=subpath,
-                        slice_=slice_list,
-                        lazy=self.lazy,
-                    )
-                    return objectview if self.lazy else objectview.compute()
+            if self._is_inside_tensor(subpath):
+                objectview = ObjectView(
+                    dataset=self,
+                    subpath=subpath,
+                    slice_=slice_list,
+                    lazy=self.lazy,
+                )
+                return objectview if self.lazy else objectview.compute()
             if len(slice_list) > 1:
                 raise ValueError("You can't slice a dictionary of Tensors")
             return self._get_dictionary(subpath, slice_list[0])
@@ -457,6 +700,13 @@ class Dataset:
         # handling strings and bytes
         assign_value = str_to_int(assign_value, self.tokenizer)
 
+        if _is_key_and_index(slice_):
+            subpath = _key_to_subpath(slice_[0])
+            if subpath not in self.keys:
+                raise KeyError(f"Key {subpath} not found in the dataset")
+            self._tensors[subpath][[slice_[1]]] = assign_value
+            return
+
         if not isinstance(slice_, abc.Iterable) or isinstance(slice_, str):
             slice_ = [slice_]
         slice_ = list(slice_)
@@ -484,6 +734,39 @@ class Dataset:
         indexes = [index for index in self.indexes if fn(self[index])]
         return DatasetView(dataset=self, lazy=self.lazy, indexes=indexes)
 
+    def filter_vectorized(self, fn, keys=None):
+        """| Applies a function on whole tensors at once as a filter to get a new DatasetView
+        | Much faster than filter as every tensor is read only once and fn is called only once
+
+        Parameters
+        ----------
+        fn: function
+            Should take in a dictionary that maps keys to numpy arrays holding the values of all the samples
+            and return a boolean array with one item per sample. The samples that are True are retained
+        keys: list, optional
+            Keys of the tensors that should be passed to fn. By default all the tensors
+            except dynamically shaped, text and object ones, which can't be read across samples
+        """
+        if keys is None:
+            keys = [
+                t_path
+                for t_dtype, t_path in self._flat_tensors
+                if not _needs_per_sample(self._tensors[t_path], t_dtype)
+            ]
+        columns = {}
+        for key in keys:
+            subpath = _key_to_subpath(key)
+            if subpath not in self.keys:
+                raise KeyError(f"Key {subpath} not found in the dataset")
+            columns[key] = self._tensors[subpath][:]
+        mask = np.asarray(fn(columns), dtype=bool)
+        if mask.shape != (self._shape[0],):
+            raise ValueError(
+                f"Filter returned mask of shape {mask.shape}, expected ({self._shape[0]},)"
+            )
+        indexes = np.nonzero(mask)[0].tolist()
+        return DatasetView(dataset=self, lazy=self.lazy, indexes=indexes)
+
     def copy(self, dst_url: str, token=None, fs=None, public=True):
         """| Creates a copy of the dataset at the specified url and returns the dataset object
         Parameters
@@ -528,7 +811,7 @@ class Dataset:
         if size == self._shape[0]:
             return
         self._shape = (int(size),)
-        self.indexes = list(range(self.shape[0]))
+        self.indexes = range(self._shape[0])
         self.meta = self._store_meta()
         for t in self._tensors.values():
             t.resize_shape(int(size))
@@ -600,33 +883,90 @@ class Dataset:
         ds = _to_tensorflow(self, indexes, include_shapes)
         return ds
 
+    def _build_key_index(self):
+        """Indexes tensor keys by every parent path, so lookups don't scan all the keys"""
+        self._keys_set = frozenset(self._tensors)
+        prefix_index = defaultdict(list)
+        for key in self._tensors:
+            pos = key.find("/")
+            while pos != -1:
+                prefix_index[key[: pos + 1]].append(key)
+                pos = key.find("/", pos + 1)
+        self._prefix_index = dict(prefix_index)
+
+    def _is_inside_tensor(self, subpath):
+        """Checks if subpath is a tensor key or a path inside of a tensor"""
+        if subpath in self._keys_set:
+            return True
+        pos = subpath.find("/", 1)
+        while pos != -1:
+            if subpath[:pos] in self._keys_set:
+                return True
+            pos = subpath.find("/", pos + 1)
+        return False
+
     def _get_dictionary(self, subpath, slice_=None):
         """Gets dictionary from dataset given incomplete subpath"""
         tensor_dict = {}
         subpath = subpath if subpath.endswith("/") else subpath + "/"
-        for key in self.keys:
-            if key.startswith(subpath):
-                suffix_key = key[len(subpath) :]
-                split_key = suffix_key.split("/")
-                cur = tensor_dict
-                for i in range(len(split_key) - 1):
-                    if split_key[i] not in cur.keys():
-                        cur[split_key[i]] = {}
-                    cur = cur[split_key[i]]
-                slice_ = slice_ or slice(0, self._shape[0])
-                tensorview = TensorView(
-                    dataset=self, subpath=key, slice_=slice_, lazy=self.lazy
-                )
-                cur[split_key[-1]] = tensorview if self.lazy else tensorview.compute()
+        for key in self._prefix_index.get(subpath, ()):
+            suffix_key = key[len(subpath) :]
+            split_key = suffix_key.split("/")
+            cur = tensor_dict
+            for i in range(len(split_key) - 1):
+                if split_key[i] not in cur.keys():
+                    cur[split_key[i]] = {}
+                cur = cur[split_key[i]]
+            slice_ = slice_ or slice(0, self._shape[0])
+            tensorview = TensorView(
+                dataset=self, subpath=key, slice_=slice_, lazy=self.lazy
+            )
+            cur[split_key[-1]] = tensorview if self.lazy else tensorview.compute()
         if not tensor_dict:
             raise KeyError(f"Key {subpath} was not found in dataset")
         return tensor_dict
 
     def __iter__(self):
-        """ Returns Iterable over samples """
+        """ Returns Iterable over samples
+        Samples are prefetched if HUB_ITER_PREFETCH environment variable is set to the prefetch window size
+        """
+        prefetch = _get_iter_prefetch()
+        if prefetch > 0:
+            yield from self.iter_prefetched(prefetch=prefetch)
+            return
         for i in range(len(self)):
             yield self[i]
 
+    def iter_prefetched(self, prefetch=8, workers=4):
+        """| Returns Iterable over samples, reading the next samples in background threads
+        | so that storage latency is hidden while the current sample is being processed
+
+        Parameters
+        ----------
+        prefetch: int, optional
+            Number of samples that are being read ahead of the one yielded
+        workers: int, optional
+            Number of threads reading the samples
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for i in range(len(self)):
+                pending.append(executor.submit(self._prefetch_sample, i))
+                if len(pending) >= prefetch:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _prefetch_sample(self, index):
+        """Reads the sample from every tensor and returns a view serving the read values"""
+        bulk = read_bulk(self, slice(index, index + 1))
+        for path in self._tensors:
+            if path not in bulk:
+                bulk[path] = [
+                    TensorView(dataset=self, subpath=path, slice_=index).numpy()
+                ]
+        return _PrefetchedView(dataset=self, index=index, bulk=bulk, lazy=self.lazy)
+
     def __len__(self):
         """ Number of samples in the dataset """
         return self._shape[0]
@@ -638,9 +978,19 @@ class Dataset:
         self.lazy = True
 
     def _save_meta(self):
-        _meta = json.loads(self._fs_map["meta.json"])
-        _meta["meta_info"] = self._meta_information
-        self._fs_map["meta.json"] = json.dumps(_meta).encode("utf-8")
+        # meta_information is changed in place by users, so compare it with what was stored last time
+        meta_info_bytes = _json_dumps(self._meta_information)
+        if meta_info_bytes == self._meta_info_bytes:
+            return
+        # meta.json is also updated by the tensors' MetaStorage, which always stores new bytes,
+        # so it only needs to be parsed again if the stored object is not the one written here
+        meta_bytes = self._fs_map["meta.json"]
+        if meta_bytes is not self._meta_bytes:
+            self._meta_dict = _json_loads(meta_bytes)
+        self._meta_dict["meta_info"] = self._meta_information
+        self._meta_bytes = _json_dumps(self._meta_dict)
+        self._fs_map["meta.json"] = self._meta_bytes
+        self._meta_info_bytes = meta_info_bytes
 
     def flush(self):
         """Save changes from cache to dataset final storage.
@@ -648,8 +998,9 @@ class Dataset:
         """
         if "r" in self._mode:
             return
-        for t in self._tensors.values():
-            t.flush()
+        # Every tensor flushes the shared meta map as well, flushing it first leaves them nothing to write there
+        self._fs_map.flush()
+        self._for_each_tensor(lambda t: t.flush())
         self._save_meta()
         self._fs_map.flush()
         self._update_dataset_state()
@@ -664,18 +1015,28 @@ class Dataset:
         This invalidates this object.
         """
         self.flush()
-        for t in self._tensors.values():
-            t.close()
+        self._for_each_tensor(lambda t: t.close())
         self._fs_map.close()
         self._update_dataset_state()
 
+    def _for_each_tensor(self, fn):
+        """Applies fn to every tensor on the shared IO thread pool, as flushing tensors is IO bound
+        The number of threads is set with HUB_IO_PARALLELISM environment variable, 1 disables them
+        """
+        tensors = list(self._tensors.values())
+        if len(tensors) > 1 and _get_io_parallelism() > 1:
+            list(_get_io_executor().map(fn, tensors))
+        else:
+            for t in tensors:
+                fn(t)
+
     def _update_dataset_state(self):
         if self.username is not None:
             HubControlClient().update_dataset_state(
                 self.username, self.dataset_name, "UPLOADED"
             )
 
-    def numpy(self, label_name=False):
+    def numpy(self, label_name=False, structured=False):
         """Gets the values from different tensorview objects in the dataset schema
 
         Parameters
@@ -683,15 +1044,40 @@ class Dataset:
         label_name: bool, optional
             If the TensorView object is of the ClassLabel type, setting this to True would retrieve the label names
             instead of the label encoded integers, otherwise this parameter is ignored.
+        structured: bool, optional
+            Setting this to True returns a structured array with one field per tensor, named by the tensor path,
+            instead of an array of dictionaries. Dynamically shaped, text and object tensors become object fields.
         """
+        bulk = read_bulk(self, slice(None), label_name=label_name)
+        if structured:
+            return self._structured_from_bulk(bulk, label_name=label_name)
         return np.array(
             [
-                create_numpy_dict(self, i, label_name=label_name)
+                create_numpy_dict(self, i, label_name=label_name, bulk=bulk)
                 for i in range(self._shape[0])
             ]
         )
 
-    def compute(self, label_name=False):
+    def _structured_from_bulk(self, bulk, label_name=False):
+        """Copies the preloaded tensors column by column into a structured array"""
+        fields = []
+        for _, t_path in self._flat_tensors:
+            if t_path in bulk:
+                value = bulk[t_path]
+                fields.append((t_path[1:], value.dtype, value.shape[1:]))
+            else:
+                fields.append((t_path[1:], object))
+        out = np.empty(self._shape[0], dtype=fields)
+        for _, t_path in self._flat_tensors:
+            if t_path in bulk:
+                out[t_path[1:]] = bulk[t_path]
+            else:
+                column = out[t_path[1:]]
+                for i in range(self._shape[0]):
+                    column[i] = self[t_path, i].numpy(label_name=label_name)
+        return out
+
+    def compute(self, label_name=False, structured=False):
         """Gets the values from different tensorview objects in the dataset schema
 
         Parameters
@@ -699,8 +1085,10 @@ class Dataset:
         label_name: bool, optional
             If the TensorView object is of the ClassLabel type, setting this to True would retrieve the label names
             instead of the label encoded integers, otherwise this parameter is ignored.
+        structured: bool, optional
+            Setting this to True returns a structured array with one field per tensor instead of an array of dictionaries.
         """
-        return self.numpy(label_name=label_name)
+        return self.numpy(label_name=label_name, structured=structured)
 
     def __str__(self):
         return (
@@ -878,63 +1266,68 @@ class Dataset:
         >>>ds.store('store_here')
         """
 
-        def get_max_shape(path_to_dir):
-            """| get_max_shape from  the images.
+        def scan_directory(path_to_dir):
+            """| scan_directory walks the root directory once to list the images and get their max shape.
 
             -------
             path_to_dir:str path to the root directory
 
             -------
-            return the maximum shape of the image
+            return the class directory names, the image paths and modes of each class and the maximum shape of the images
 
             -------
 
             """
-            try:
-
-                for i in os.listdir(path_to_dir):
-                    for j in os.listdir(os.path.join(path_to_dir, i)):
-
-                        if j.endswith((".png", ".jpg", ".jpeg", ".tiff", ".bmp")):
-                            img_path = os.path.join(path_to_dir, i, j)
-                        else:
-                            print(
-                                f"{os.path.join(path_to_dir,i,j)} is a non image file please remove it to execute...."
-                            )
+            class_names = []
+            class_images = []
+            with os.scandir(path_to_dir) as class_entries:
+                for i in class_entries:
+                    if not i.is_dir():
+                        continue
+                    class_names.append(i.name)
+                    with os.scandir(i.path) as file_entries:
+                        paths = [
+                            j.path
+                            for j in file_entries
+                            if _extension(j.name) in _IMG_EXTS
+                        ]
+                    class_images.append((i.name, paths, []))
 
-                        image = im.open(img_path)
-
-                        width = set()
-                        height = set()
-                        mode = set()
-
-                        detail = list(image.size)
+            try:
+                # Probing is I/O bound, so the files are read concurrently
+                images = itertools.chain.from_iterable(
+                    paths for _, paths, _ in class_images
+                )
+                if _get_io_parallelism() > 1:
+                    probed = _get_io_executor().map(_image_size_and_mode, images)
+                else:
+                    probed = map(_image_size_and_mode, images)
 
-                        width.add(detail[0])
-                        height.add(detail[1])
+                max_width = max_height = max_channels = 0
+                for _, paths, modes in class_images:
+                    for width, height, mode in itertools.islice(probed, len(paths)):
+                        modes.append(mode)
+                        channels = _MODE_CH.get(mode, 1)
 
-                        if image.mode == "RGB":
-                            mode.add(3)
-                        elif image.mode == "RGBA":
-                            mode.add(4)
-                        elif image.mode == "LA":
-                            mode.add(2)
-                        else:
-                            mode.add(1)
+                        max_width = width if width > max_width else max_width
+                        max_height = height if height > max_height else max_height
+                        max_channels = (
+                            channels if channels > max_channels else max_channels
+                        )
 
-                max_shape = [max(width), max(height), max(mode)]
-                return max_shape
+                max_shape = [max_height, max_width, max_channels]
             except Exception:
                 print("check your data for fix")
+                max_shape = None
+            return class_names, class_images, max_shape
 
-        def make_schema(path_to_dir, labels, dtype):
+        def make_schema(class_names, labels, dtype, max_shape):
             """| make_schema internal function to generate the schema internally."""
-            max_shape = get_max_shape(path_to_dir)
             image_shape = (None, None, None)
             if labels is None:
-                labels = ClassLabel(names=os.listdir(path_to_dir))
+                labels = ClassLabel(names=class_names)
             else:
-                labels = ClassLabel(labels)
+                labels = ClassLabel(names=labels)
             schema = {
                 "label": labels,
                 "image": Tensor(
@@ -946,50 +1339,60 @@ class Dataset:
 
             return schema
 
-        schema = make_schema(path_to_dir, labels, dtype)
-
-        if labels is not None:
+        class_names, class_images, max_shape = scan_directory(path_to_dir)
+        schema = make_schema(class_names, labels, dtype, max_shape)
 
-            label_dic = {}
-            for i, label in enumerate(labels):
-                label_dic[label] = i
-        else:
-            labels_v = os.listdir(path_to_dir)
-            label_dic = {}
-            for i, label in enumerate(labels_v):
-                label_dic[label] = i
+        class_names = schema["label"].names
+        label_dic = {name: i for i, name in enumerate(class_names)}
 
         @hub.transform(schema=schema, scheduler=scheduler, workers=workers)
         def upload_data(sample):
             """| This upload_data function is for upload the images internally using `hub.transform`."""
 
-            path_to_image = sample[1]
-
-            pre_image = im.open(path_to_image)
-            image = np.asarray(pre_image)
-            image = image.astype(sample[2])
-            image_shape = get_max_shape(path_to_dir)
+            label, path_to_image, mode, raw = sample
 
-            if pre_image.mode == "RGB":
-                image = np.resize(image, (*image_shape[:2], 3))
-            elif pre_image.mode == "RGBA":
-                image = np.resize(image, (*image_shape[:2], 4))
-            elif pre_image.mode == "LA":
-                image = np.resize(image, (*image_shape[:2], 2))
-            else:
-                image = np.resize(image, (*image_shape[:2], 1))
+            image_shape = max_shape
+            size = (image_shape[1], image_shape[0])
+            # 8-bit pixels are kept as uint8 and cast to dtype by the storage on write,
+            # higher bit depths are cast to dtype while decoding
+            out_dtype = "uint8" if _is_8bit_mode(mode) else dtype
 
-            return {"label": label_dic[sample[0]], "image": image}
+            if (
+                cv2 is not None
+                and mode in ("L", "RGB", "RGBA")
+                and _extension(path_to_image) in _CV2_EXTS
+            ):
+                pixels = _decode_image_cv2(raw, mode, size)
+                if pixels is not None:
+                    channels = _MODE_CH.get(mode, 1)
+                    image = pixels.reshape((*image_shape[:2], channels))
+                    return {"label": label, "image": image}
+
+            with im.open(io.BytesIO(raw)) as pre_image:
+                mode = pre_image.mode
+                # Single band images keep their mode and bit depth, the other
+                # multi band modes are stored as grayscale
+                if mode not in _MODE_CH and len(pre_image.getbands()) > 1:
+                    mode = "L"
+                if pre_image.mode != mode:
+                    pre_image = pre_image.convert(mode)
+                if pre_image.size != size:
+                    pre_image = pre_image.resize(size, im.BILINEAR)
+                image = np.empty((*image_shape[:2], _MODE_CH.get(mode, 1)), out_dtype)
+                if mode in _MODE_CH or mode in ("L", "P"):
+                    # These modes hold one byte per band, the raw pixels are copied
+                    # straight into the output instead of through intermediate arrays
+                    image[...] = np.frombuffer(
+                        pre_image.tobytes(), dtype="uint8"
+                    ).reshape(image.shape)
+                else:
+                    image[...] = np.asarray(pre_image).reshape(image.shape)
 
-        images = []
-        labels_list = []
-        dataype = []
-        for i in os.listdir(path_to_dir):
-            for j in os.listdir(os.path.join(path_to_dir, i)):
-                image = os.path.join(path_to_dir, i, j)
-                images.append(image)
-                labels_list.append(i)
-                dataype.append(dtype)
+            return {"label": label, "image": image}
 
-        ds = upload_data(zip(labels_list, images, dataype))
+        samples = _ReadAheadSamples(
+            [(label_dic[name], paths, modes) for name, paths, modes in class_images],
+            defaults.DEFAULT_FROM_DIRECTORY_READ_AHEAD,
+        )
+        ds = upload_data(samples)
         return ds
@@ -9,6 +9,7 @@ from hub.store.store import get_fs_and_path
 import numpy as np
 import sys
 from hub.exceptions import ModuleNotInstalledException, DirectoryNotEmptyException
+from hub.schema import ClassLabel, Sequence, Text
 
 
 def slice_split(slice_):
@@ -78,7 +79,41 @@ def slice_extract_info(slice_, num):
     return num, offset
 
 
-def create_numpy_dict(dataset, index, label_name=False):
+def _needs_per_sample(tensor, t_dtype) -> bool:
+    """Dynamically shaped, text and object tensors can't be read as one array across samples"""
+    return (
+        tensor.is_dynamic
+        or isinstance(t_dtype, (Text, Sequence))
+        or tensor.dtype == "object"
+    )
+
+
+def read_bulk(dataset, slice_, label_name=False):
+    """Reads the records of slice_ at once from every tensor that doesn't need per record post processing.
+
+    Parameters
+    ----------
+    dataset: hub.api.dataset.Dataset object
+        The dataset whose tensors are being read.
+    slice_: slice
+        The contiguous range of records that is being read.
+    label_name: bool, optional
+        If the tensor is of the ClassLabel type, setting this to True would retrieve the label names
+        instead of the label encoded integers, otherwise this parameter is ignored.
+    """
+    bulk = {}
+    for t_dtype, t_path in dataset._flat_tensors:
+        tensor = dataset._tensors[t_path]
+        if _needs_per_sample(tensor, t_dtype):
+            continue
+        value = tensor[slice_]
+        if label_name and isinstance(t_dtype, ClassLabel):
+            value = np.array(t_dtype.names, dtype="object")[value]
+        bulk[t_path] = value
+    return bulk
+
+
+def create_numpy_dict(dataset, index, label_name=False, bulk=None, offset=0):
     """Creates a list of dictionaries with the values from the tensorview objects in the dataset schema.
 
     Parameters
@@ -90,7 +125,13 @@ def create_numpy_dict(dataset, index, label_name=False):
     label_name: bool, optional
         If the TensorView object is of the ClassLabel type, setting this to True would retrieve the label names
         instead of the label encoded integers, otherwise this parameter is ignored.
+    bulk: dict, optional
+        Tensors preloaded with read_bulk, the values of the tensors in it are taken from there
+        instead of being read through their TensorView objects.
+    offset: int, optional
+        Index of the first record of the range bulk was read for.
     """
+    bulk = bulk or {}
     numpy_dict = {}
     for path in dataset._tensors.keys():
         d = numpy_dict
@@ -99,7 +140,10 @@ def create_numpy_dict(dataset, index, label_name=False):
             if subpath not in d:
                 d[subpath] = {}
             d = d[subpath]
-        d[split[-1]] = dataset[path, index].numpy(label_name=label_name)
+        if path in bulk:
+            d[split[-1]] = bulk[path][index - offset]
+        else:
+            d[split[-1]] = dataset[path, index].numpy(label_name=label_name)
     return numpy_dict
 
 
@@ -10,6 +10,7 @@ import collections.abc as abc
 from hub.api.dataset_utils import (
     create_numpy_dict,
     get_value,
+    read_bulk,
     slice_split,
     str_to_int,
 )
@@ -19,12 +20,26 @@ from hub.schema import Sequence
 import numpy as np
 
 
+def _materialize(indexes):
+    """Enumerates range indexes for the operations that need a list of them"""
+    return list(indexes) if isinstance(indexes, range) else indexes
+
+
+def _range_to_slice(indexes):
+    """Turns a non empty range with step 1 into the equivalent slice, other ranges into lists"""
+    if isinstance(indexes, range):
+        if indexes.step == 1 and len(indexes) > 0:
+            return slice(indexes.start, indexes.stop)
+        return list(indexes)
+    return indexes
+
+
 class DatasetView:
     def __init__(
         self,
         dataset=None,
         lazy: bool = True,
-        indexes=None,  # list or integer
+        indexes=None,  # list, range or integer
     ):
         """Creates a DatasetView object for a subset of the Dataset.
 
@@ -35,7 +50,8 @@ class DatasetView:
         lazy: bool, optional
             Setting this to False will stop lazy computation and will allow items to be accessed without .compute()
         indexes: optional
-            It can be either a list or an integer depending upon the slicing. Represents the indexes that the datasetview is representing.
+            It can be either a list, a range or an integer depending upon the slicing. Represents the indexes that the datasetview is representing.
+            Ranges are kept as they are and only enumerated when needed.
         """
         if dataset is None:
             raise NoneValueException("dataset")
@@ -46,7 +62,9 @@ class DatasetView:
         self.lazy = lazy
         self.indexes = indexes
         self.is_contiguous = False
-        if isinstance(self.indexes, list) and self.indexes:
+        if isinstance(self.indexes, range):
+            self.is_contiguous = self.indexes.step == 1 and len(self.indexes) > 0
+        elif isinstance(self.indexes, list) and self.indexes:
             self.is_contiguous = self.indexes[-1] - self.indexes[0] + 1 == len(
                 self.indexes
             )
@@ -72,7 +90,7 @@ class DatasetView:
             slice_ = (
                 [slice(self.indexes[0], self.indexes[-1] + 1)]
                 if self.is_contiguous
-                else [self.indexes]
+                else [_materialize(self.indexes)]
             )
             if subpath in self.keys:
                 tensorview = TensorView(
@@ -82,18 +100,19 @@ class DatasetView:
                     lazy=self.lazy,
                 )
                 return tensorview if self.lazy else tensorview.compute()
-            for key in self.keys:
-                if subpath.startswith(key):
-                    objectview = ObjectView(
-                        dataset=self.dataset,
-                        subpath=subpath,
-                        slice_=slice_,
-                        lazy=self.lazy,
-                    )
-                    return objectview if self.lazy else objectview.compute()
+            if self.dataset._is_inside_tensor(subpath):
+                objectview = ObjectView(
+                    dataset=self.dataset,
+                    subpath=subpath,
+                    slice_=slice_,
+                    lazy=self.lazy,
+                )
+                return objectview if self.lazy else objectview.compute()
             return self._get_dictionary(subpath, slice_)
         else:
-            if isinstance(self.indexes, list):
+            if isinstance(self.indexes, range):
+                indexes = _range_to_slice(self.indexes[slice_list[0]])
+            elif isinstance(self.indexes, list):
                 indexes = self.indexes[slice_list[0]]
                 if self.is_contiguous and isinstance(indexes, list) and indexes:
                     indexes = slice(indexes[0], indexes[-1] + 1)
@@ -112,15 +131,14 @@ class DatasetView:
                     lazy=self.lazy,
                 )
                 return tensorview if self.lazy else tensorview.compute()
-            for key in self.keys:
-                if subpath.startswith(key):
-                    objectview = ObjectView(
-                        dataset=self.dataset,
-                        subpath=subpath,
-                        slice_=slice_list,
-                        lazy=self.lazy,
-                    )
-                    return objectview if self.lazy else objectview.compute()
+            if self.dataset._is_inside_tensor(subpath):
+                objectview = ObjectView(
+                    dataset=self.dataset,
+                    subpath=subpath,
+                    slice_=slice_list,
+                    lazy=self.lazy,
+                )
+                return objectview if self.lazy else objectview.compute()
             if len(slice_list) > 1:
                 raise ValueError("You can't slice a dictionary of Tensors")
             return self._get_dictionary(subpath, slice_list[0])
@@ -152,7 +170,7 @@ class DatasetView:
             slice_ = (
                 slice(self.indexes[0], self.indexes[-1] + 1)
                 if self.is_contiguous
-                else self.indexes
+                else _materialize(self.indexes)
             )
             if not isinstance(slice_, list):
                 self.dataset._tensors[subpath][slice_] = assign_value
@@ -160,7 +178,9 @@ class DatasetView:
                 for i, index in enumerate(slice_):
                     self.dataset._tensors[subpath][index] = assign_value[i]
         else:
-            if isinstance(self.indexes, list):
+            if isinstance(self.indexes, range):
+                slice_list[0] = _range_to_slice(self.indexes[slice_list[0]])
+            elif isinstance(self.indexes, list):
                 indexes = self.indexes[slice_list[0]]
                 if self.is_contiguous and isinstance(indexes, list) and indexes:
                     slice_list[0] = slice(indexes[0], indexes[-1] + 1)
@@ -211,22 +231,21 @@ class DatasetView:
         """Gets dictionary from dataset given incomplete subpath"""
         tensor_dict = {}
         subpath = subpath if subpath.endswith("/") else subpath + "/"
-        for key in self.keys:
-            if key.startswith(subpath):
-                suffix_key = key[len(subpath) :]
-                split_key = suffix_key.split("/")
-                cur = tensor_dict
-                for sub_key in split_key[:-1]:
-                    if sub_key not in cur.keys():
-                        cur[sub_key] = {}
-                    cur = cur[sub_key]
-                tensorview = TensorView(
-                    dataset=self.dataset,
-                    subpath=key,
-                    slice_=slice_,
-                    lazy=self.lazy,
-                )
-                cur[split_key[-1]] = tensorview if self.lazy else tensorview.compute()
+        for key in self.dataset._prefix_index.get(subpath, ()):
+            suffix_key = key[len(subpath) :]
+            split_key = suffix_key.split("/")
+            cur = tensor_dict
+            for sub_key in split_key[:-1]:
+                if sub_key not in cur.keys():
+                    cur[sub_key] = {}
+                cur = cur[sub_key]
+            tensorview = TensorView(
+                dataset=self.dataset,
+                subpath=key,
+                slice_=slice_,
+                lazy=self.lazy,
+            )
+            cur[split_key[-1]] = tensorview if self.lazy else tensorview.compute()
         if not tensor_dict:
             raise KeyError(f"Key {subpath} was not found in dataset")
         return tensor_dict
@@ -241,7 +260,7 @@ class DatasetView:
             yield self[i]
 
     def __len__(self):
-        return len(self.indexes) if isinstance(self.indexes, list) else 1
+        return len(self.indexes) if isinstance(self.indexes, (list, range)) else 1
 
     def __str__(self):
         return "DatasetView(" + str(self.dataset) + ")"
@@ -306,13 +325,27 @@ class DatasetView:
         """
         if isinstance(self.indexes, int):
             return create_numpy_dict(self.dataset, self.indexes, label_name=label_name)
-        else:
-            return np.array(
-                [
-                    create_numpy_dict(self.dataset, index, label_name=label_name)
-                    for index in self.indexes
-                ]
+        bulk, offset = None, 0
+        if self.is_contiguous:
+            # static tensors of contiguous views are read at once
+            offset = self.indexes[0]
+            bulk = read_bulk(
+                self.dataset,
+                slice(offset, self.indexes[-1] + 1),
+                label_name=label_name,
             )
+        return np.array(
+            [
+                create_numpy_dict(
+                    self.dataset,
+                    index,
+                    label_name=label_name,
+                    bulk=bulk,
+                    offset=offset,
+                )
+                for index in self.indexes
+            ]
+        )
 
     def disable_lazy(self):
         self.lazy = False
@@ -330,3 +363,50 @@ class DatasetView:
             instead of the label encoded integers, otherwise this parameter is ignored.
         """
         return self.numpy(label_name=label_name)
+
+
+class _PrefetchedTensor:
+    """Value of one tensor of a _PrefetchedView, computed like a TensorView without reading it again"""
+
+    def __init__(self, view, subpath):
+        self._view = view
+        self._subpath = subpath
+
+    def numpy(self, label_name=False):
+        if label_name:
+            # label names are not prefetched, read them through the TensorView
+            return TensorView(
+                dataset=self._view.dataset,
+                subpath=self._subpath,
+                slice_=self._view.indexes,
+            ).numpy(label_name=True)
+        return self._view._bulk[self._subpath][0]
+
+    def compute(self, label_name=False):
+        return self.numpy(label_name=label_name)
+
+
+class _PrefetchedView(DatasetView):
+    """DatasetView of a single sample whose tensors were already read by Dataset.iter_prefetched.
+    Whole tensors and the whole sample are served from the read values, other slices read the dataset again.
+    """
+
+    def __init__(self, dataset, index, bulk, lazy=True):
+        super().__init__(dataset=dataset, lazy=lazy, indexes=index)
+        # maps every tensor path to a one item sequence with its value for this sample
+        self._bulk = bulk
+
+    def __getitem__(self, slice_):
+        if isinstance(slice_, str):
+            subpath = slice_ if slice_.startswith("/") else "/" + slice_
+            if subpath in self._bulk:
+                tensor = _PrefetchedTensor(self, subpath)
+                return tensor if self.lazy else tensor.compute()
+        return super().__getitem__(slice_)
+
+    def numpy(self, label_name=False):
+        if label_name:
+            return super().numpy(label_name=True)
+        return create_numpy_dict(
+            self.dataset, self.indexes, bulk=self._bulk, offset=self.indexes
+        )
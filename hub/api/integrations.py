@@ -50,6 +50,19 @@ def _to_pytorch(
     )
 
 
+def _keep_sample(sample):
+    """Passed as DataLoader collate_fn so samples are returned as the dataset produced them"""
+    return sample
+
+
+def _loader_worker_kwargs(torch_version: str):
+    """DataLoader options keeping the workers alive and reading ahead, only accepted since torch 1.7"""
+    major, minor = (int(part) for part in torch_version.split(".")[:2])
+    if (major, minor) < (1, 7):
+        return {}
+    return {"persistent_workers": True, "prefetch_factor": 4}
+
+
 def _from_pytorch(dataset, scheduler: str = "single", workers: int = 1):
     """| Converts a pytorch dataset object into hub format
 
@@ -72,6 +85,23 @@ def _from_pytorch(dataset, scheduler: str = "single", workers: int = 1):
 
     max_dict = defaultdict(lambda: None)
 
+    source = dataset
+    if (
+        scheduler in ("threaded", "processed")
+        and workers > 1
+        and isinstance(dataset, torch.utils.data.Dataset)
+        and not isinstance(dataset, torch.utils.data.IterableDataset)
+    ):
+        # Samples are fetched by DataLoader worker processes, overlapping the
+        # dataset's __getitem__ with the transform instead of calling it in the main process
+        source = torch.utils.data.DataLoader(
+            dataset,
+            batch_size=None,
+            num_workers=workers,
+            collate_fn=_keep_sample,
+            **_loader_worker_kwargs(torch.__version__),
+        )
+
     def sampling(ds):
         for sample in ds:
             dict_sampling(sample)
@@ -95,7 +125,7 @@ def _from_pytorch(dataset, scheduler: str = "single", workers: int = 1):
                         [max(value) for value in zip(max_dict[cur_path], v.shape)]
                     )
 
-    sampling(dataset)
+    sampling(source)
 
     def generate_schema(dataset):
         sample = dataset[0]
@@ -140,7 +170,7 @@ def _from_pytorch(dataset, scheduler: str = "single", workers: int = 1):
     def my_transform(sample):
         return transform_numpy(sample)
 
-    return my_transform(dataset)
+    return my_transform(source)
 
 
 def _to_tensorflow(dataset, indexes=None, include_shapes=False):
@@ -562,7 +592,7 @@ class TorchDataset:
 
     def __len__(self):
         self._init_ds()
-        return len(self.indexes) if isinstance(self.indexes, list) else 1
+        return 1 if isinstance(self.indexes, int) else len(self.indexes)
 
     def _get_active_item(self, key, index):
         active_range = self._active_chunks_range.get(key)
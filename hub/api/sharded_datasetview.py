@@ -24,7 +24,7 @@ class ShardedDatasetView:
         self._schema = datasets[0].schema if datasets else None
         self.datasets = [
             ds
-            if isinstance(ds.indexes, list)
+            if isinstance(ds.indexes, (list, range))
             else ds.dataset[ds.indexes : ds.indexes + 1]
             for ds in datasets
         ]
@@ -4,7 +4,11 @@ This Source Code Form is subject to the terms of the Mozilla Public License, v.
 If a copy of the MPL was not distributed with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 """
 
+import sys
+import types
+
 import hub.api.tests.test_converters
+from hub.api.integrations import _loader_worker_kwargs
 from hub.schema.features import Tensor
 import numpy as np
 from hub.utils import tfds_loaded, tensorflow_loaded, pytorch_loaded
@@ -323,6 +327,98 @@ def test_from_pytorch():
     assert ds["labels", "named", 5].numpy() == "testing text labels"
 
 
+@pytest.mark.skipif(not pytorch_loaded(), reason="requires pytorch to be loaded")
+@pytest.mark.parametrize("scheduler", ["threaded", "processed"])
+def test_from_pytorch_workers(scheduler):
+    from torch.utils.data import Dataset
+
+    class TestDataset(Dataset):
+        def __len__(self):
+            return 12
+
+        def __getitem__(self, idx):
+            return {
+                "image": idx * np.ones((32, 32, 3)),
+                "labels": {"named": "label " + str(idx)},
+            }
+
+    ds = hub.Dataset.from_pytorch(TestDataset(), scheduler=scheduler, workers=2)
+    ds = ds.store(f"./data/test_from_pytorch/test_workers_{scheduler}")
+
+    assert len(ds) == 12
+    for i in range(12):
+        assert (ds["image", i].numpy() == i * np.ones((32, 32, 3))).all()
+        assert ds["labels", "named", i].numpy() == "label " + str(i)
+
+
+def test_loader_worker_kwargs():
+    assert _loader_worker_kwargs("1.0.0") == {}
+    assert _loader_worker_kwargs("1.6.0+cpu") == {}
+    assert _loader_worker_kwargs("1.7.1+cu110") == {
+        "persistent_workers": True,
+        "prefetch_factor": 4,
+    }
+    assert _loader_worker_kwargs("1.10.2") == _loader_worker_kwargs("1.7.0")
+
+
+@pytest.mark.parametrize("version", ["1.6.0", "1.8.1"])
+def test_from_pytorch_workers_loader(version, monkeypatch):
+    # Stands in for torch so that the DataLoader branch is covered without it installed
+    loaders = []
+
+    class FakeDataset:
+        pass
+
+    class FakeDataLoader:
+        def __init__(self, dataset, batch_size=1, num_workers=0, collate_fn=None):
+            loaders.append(num_workers)
+            self.dataset = dataset
+            self.collate_fn = collate_fn
+
+        def __len__(self):
+            return len(self.dataset)
+
+        def __iter__(self):
+            for i in range(len(self.dataset)):
+                yield self.collate_fn(self.dataset[i])
+
+    class FakeDataLoader17(FakeDataLoader):
+        def __init__(
+            self, dataset, persistent_workers=False, prefetch_factor=2, **kwargs
+        ):
+            assert persistent_workers and prefetch_factor == 4
+            super().__init__(dataset, **kwargs)
+
+    torch = types.ModuleType("torch")
+    torch.__version__ = version
+    torch.Tensor = type("FakeTensor", (), {})
+    torch.utils = types.SimpleNamespace(
+        data=types.SimpleNamespace(
+            Dataset=FakeDataset,
+            IterableDataset=type("FakeIterableDataset", (FakeDataset,), {}),
+            DataLoader=FakeDataLoader if version < "1.7" else FakeDataLoader17,
+        )
+    )
+    monkeypatch.setitem(sys.modules, "torch", torch)
+    # _from_pytorch binds the module global, restore it afterwards too
+    monkeypatch.setattr(hub.api.integrations, "torch", torch, raising=False)
+
+    class TestDataset(FakeDataset):
+        def __len__(self):
+            return 6
+
+        def __getitem__(self, idx):
+            return {"image": idx * np.ones((4, 4, 3)), "labels": {"named": str(idx)}}
+
+    ds = hub.Dataset.from_pytorch(TestDataset(), scheduler="threaded", workers=2)
+    ds = ds.store(f"./data/test_from_pytorch/test_workers_loader_{version}")
+    assert loaders == [2]
+    assert len(ds) == 6
+    for i in range(6):
+        assert (ds["image", i].numpy() == i * np.ones((4, 4, 3))).all()
+        assert ds["labels", "named", i].numpy() == str(i)
+
+
 @pytest.mark.skipif(not pytorch_loaded(), reason="requires pytorch to be loaded")
 def test_to_from_pytorch():
     my_schema = {
@@ -17,6 +17,7 @@ import pytest
 from hub import transform
 from hub import load
 import hub.api.dataset as dataset
+from hub.store.dynamic_tensor import DynamicTensor
 from hub.schema import Tensor, Text, Image, Sequence, BBox, SchemaDict, ClassLabel
 from hub.utils import (
     gcp_creds_exist,
@@ -508,6 +509,105 @@ def test_dataset_from_directory():
     del_data(root_url, store_url)
 
 
+def test_dataset_from_directory_max_shape():
+    from PIL import Image
+
+    root_url = "./data/categorical_label_data_shapes"
+    if os.path.exists(root_url):
+        shutil.rmtree(root_url)
+    for i, size in enumerate([(30, 20), (10, 40), (20, 10)]):
+        os.makedirs(os.path.join(root_url, "data_" + str(i)))
+        img = Image.fromarray(np.ones((size[1], size[0], 3), dtype="uint8"))
+        img.save(os.path.join(root_url, "data_" + str(i), "0.png"))
+    with open(os.path.join(root_url, "data_0", "notes.txt"), "w") as f:
+        f.write("not an image")
+
+    ds = Dataset.from_directory(root_url)
+
+    assert ds.schema["image"].max_shape == (40, 30, 3)
+    ds = ds.store("./data/categorical_label_data_shapes_store")
+    assert len(ds) == 3
+    assert (ds["image", 1].compute() == np.ones((40, 30, 3))).all()
+
+    ds = Dataset.from_directory(root_url, labels=["data_2", "data_1", "data_0"])
+    assert ds.schema["label"].names == ["data_2", "data_1", "data_0"]
+
+    ds = Dataset.from_directory(root_url, dtype="float32")
+    ds = ds.store("./data/categorical_label_data_shapes_store")
+    image = ds["image", 2].compute()
+    assert image.dtype == "float32"
+    assert (image == np.ones((40, 30, 3))).all()
+    shutil.rmtree(root_url)
+    shutil.rmtree("./data/categorical_label_data_shapes_store")
+
+
+def test_dataset_from_directory_16bit():
+    from PIL import Image
+
+    root_url = "./data/categorical_label_data_16bit"
+    if os.path.exists(root_url):
+        shutil.rmtree(root_url)
+    os.makedirs(os.path.join(root_url, "data_0"))
+    for i, value in enumerate([1000, 2000]):
+        img = Image.fromarray(np.full((6, 4), value, dtype="uint16"))
+        img.save(os.path.join(root_url, "data_0", str(i) + ".png"))
+
+    ds = Dataset.from_directory(root_url, dtype="uint16")
+    ds = ds.store("./data/categorical_label_data_16bit_store")
+
+    values = sorted(int(ds["image", i].compute().max()) for i in range(2))
+    assert values == [1000, 2000]
+    assert ds["image", 0].compute().shape == (6, 4, 1)
+    shutil.rmtree(root_url)
+    shutil.rmtree("./data/categorical_label_data_16bit_store")
+
+
+@pytest.mark.parametrize("mode", ["L", "RGB", "RGBA"])
+def test_dataset_from_directory_without_cv2(mode, monkeypatch):
+    from PIL import Image
+
+    root_url = "./data/categorical_label_data_cv2_" + mode
+    if os.path.exists(root_url):
+        shutil.rmtree(root_url)
+    os.makedirs(os.path.join(root_url, "data_0"))
+    rng = np.random.default_rng(0)
+    for i, size in enumerate([(12, 8), (25, 30)]):
+        channels = len(mode)
+        pixels = rng.integers(0, 256, (size[1], size[0], channels), dtype="uint8")
+        img = Image.fromarray(pixels.squeeze(-1) if channels == 1 else pixels, mode)
+        img.save(os.path.join(root_url, "data_0", str(i) + ".png"))
+
+    def stored_images(store_url):
+        ds = Dataset.from_directory(root_url).store(store_url)
+        images = [ds["image", i].compute() for i in range(len(ds))]
+        shutil.rmtree(store_url)
+        return images
+
+    with_cv2 = stored_images("./data/categorical_label_data_cv2_store")
+    monkeypatch.setattr(dataset, "cv2", None)
+    without_cv2 = stored_images("./data/categorical_label_data_cv2_store")
+    shutil.rmtree(root_url)
+    assert len(with_cv2) == len(without_cv2) == 2
+    for image, expected in zip(with_cv2, without_cv2):
+        assert image.shape == (30, 25, len(mode))
+        assert (image == expected).all()
+
+
+def test_dataset_image_size_and_mode():
+    from PIL import Image
+
+    os.makedirs("./data/test/image_headers", exist_ok=True)
+    for mode, size in [("L", (7, 5)), ("RGB", (13, 9)), ("RGBA", (4, 11))]:
+        for ext in ["png", "jpg", "bmp"]:
+            if mode == "RGBA" and ext != "png":
+                continue
+            path = os.path.join("./data/test/image_headers", mode + "." + ext)
+            Image.new(mode, size).save(path)
+            assert dataset._image_size_and_mode(path) == (*size, mode)
+            assert (dataset._probe_image_header(path) is None) == (ext == "bmp")
+    shutil.rmtree("./data/test/image_headers")
+
+
 @pytest.mark.skipif(
     not transformers_loaded(), reason="requires transformers to be loaded"
 )
@@ -1045,6 +1145,163 @@ def test_dataset_filter_4():
     assert (ds_filtered[3:8, "cl"].compute() == np.zeros((5,))).all()
 
 
+def test_dataset_indexes():
+    schema = {"abc": "int32"}
+    ds = Dataset("./data/test/ds_indexes", shape=(10,), schema=schema, mode="w")
+    assert ds.indexes == range(10)
+    assert ds[2:5].indexes == range(2, 5)
+    ds.append_shape(5)
+    assert ds.indexes == range(15)
+    assert len(ds.filter(lambda x: True)) == 15
+
+
+def test_datasetview_range_indexes():
+    schema = {"abc": "int32", "img": Tensor((2, 2), "int32")}
+    ds = Dataset("./data/test/dsv_range", shape=(10,), schema=schema, mode="w")
+    dsv = ds[1:9:2]
+    assert dsv.indexes == range(1, 9, 2)
+    assert len(dsv) == 4
+    dsv["abc"] = np.array([1, 2, 3, 4])
+    dsv["img", 1:3] = np.ones((2, 2, 2), "int32")
+    assert ds["abc"].compute().tolist() == [0, 1, 0, 2, 0, 3, 0, 4, 0, 0]
+    assert dsv["abc", 1:].compute().tolist() == [2, 3, 4]
+    assert ds["img", 5].compute().sum() == 4 and ds["img", 7].compute().sum() == 0
+    dsv = ds[2:8][1:4]
+    assert dsv.indexes == range(3, 6)
+    assert dsv["abc"].compute().tolist() == [2, 0, 3]
+    assert [sample["abc"].compute() for sample in dsv] == [2, 0, 3]
+    assert dsv[1].indexes == 4
+    assert ds[5:5]["abc"].compute().tolist() == []
+
+
+def test_dataset_key_index():
+    schema = {"ab": "int32", "abc": {"d": "int32", "e": {"f": "int32"}}}
+    ds = Dataset("./data/test/ds_key_index", shape=(2,), schema=schema, mode="w")
+    assert ds._is_inside_tensor("/ab")
+    assert ds._is_inside_tensor("/ab/x")
+    assert not ds._is_inside_tensor("/abc")
+    assert not ds._is_inside_tensor("/abc/e")
+    assert ds._prefix_index["/abc/"] == ["/abc/d", "/abc/e/f"]
+    assert ds._prefix_index["/abc/e/"] == ["/abc/e/f"]
+    assert sorted(ds["abc"].keys()) == ["d", "e"]
+    assert list(ds[1:2]["abc/e"].keys()) == ["f"]
+
+
+@pytest.mark.parametrize("parallelism", ["1", "4"])
+def test_dataset_io_parallelism(monkeypatch, parallelism):
+    monkeypatch.setenv("HUB_IO_PARALLELISM", parallelism)
+    schema = {f"t{i}": Tensor((3,), "int32") for i in range(8)}
+    url = "./data/test/ds_io_parallelism"
+    ds = Dataset(url, shape=(4,), schema=schema, mode="w")
+    for i in range(8):
+        ds[f"t{i}", 2] = np.array([i, i, i])
+    ds.meta_information["flushed"] = parallelism
+    ds.close()
+    ds = Dataset(url)
+    assert ds.meta_information["flushed"] == parallelism
+    for i in range(8):
+        assert (ds[f"t{i}", 2].compute() == np.array([i, i, i])).all()
+
+
+def test_dataset_schema_cache():
+    schema = {"first": "float", "img": Image((None, None, 3), max_shape=(4, 4, 3))}
+    Dataset("./data/test/ds_schema_cache", shape=(2,), schema=schema, mode="w").close()
+    ds1 = Dataset("./data/test/ds_schema_cache")
+    ds2 = Dataset("./data/test/ds_schema_cache", mode="r")
+    assert ds1.schema is ds2.schema
+    assert ds1["first", 1].compute() == 0
+
+
+def test_dataset_save_meta():
+    schema = {"first": "float"}
+    ds = Dataset("./data/test/ds_save_meta", shape=(2,), schema=schema, mode="w")
+    meta_bytes = ds._fs_map["meta.json"]
+    ds.flush()
+    assert ds._fs_map["meta.json"] is meta_bytes
+    ds.meta_information["version"] = "saved"
+    ds.flush()
+    assert ds._fs_map["meta.json"] is not meta_bytes
+    ds.close()
+    ds = Dataset("./data/test/ds_save_meta")
+    assert ds.meta_information["version"] == "saved"
+
+
+def test_dataset_key_and_index():
+    schema = {"first": "int32", "nested": {"second": Tensor((2,), "int32")}}
+    ds = Dataset("./data/test/ds_key_and_index", shape=(4,), schema=schema, mode="w")
+    ds["first", 1] = 5
+    ds["/nested/second", 2] = np.array([1, 2])
+    ds["nested/second", 1:3] = np.array([[3, 4], [5, 6]])
+    assert ds["first", 1].compute() == 5
+    assert ds["/first", 0:2].compute().tolist() == [0, 5]
+    assert ds["nested/second", 2].compute().tolist() == [5, 6]
+    with pytest.raises(KeyError):
+        ds["third", 0] = 1
+
+
+@pytest.mark.parametrize("prefetch", ["0", "3"])
+def test_dataset_iter_prefetched(prefetch, monkeypatch):
+    monkeypatch.setenv("HUB_ITER_PREFETCH", prefetch)
+    schema = {"first": "int32", "text": Text((None,), max_shape=(10,))}
+    ds = Dataset("./data/test/ds_iter_prefetched", shape=(7,), schema=schema, mode="w")
+    for i in range(7):
+        ds["first", i] = i
+        ds["text", i] = str(i)
+    assert [item["first"].compute() for item in ds] == list(range(7))
+    assert [item["text"].compute() for item in ds.iter_prefetched(2, 2)] == [
+        str(i) for i in range(7)
+    ]
+    reads = []
+    getitem = DynamicTensor.__getitem__
+    monkeypatch.setattr(
+        DynamicTensor,
+        "__getitem__",
+        lambda self, slice_: reads.append(slice_) or getitem(self, slice_),
+    )
+    samples = [item.compute() for item in ds.iter_prefetched(2, 2)]
+    assert samples == [{"first": i, "text": str(i)} for i in range(7)]
+    # every tensor is read once per sample, the views don't read it again
+    assert len(reads) == 14
+
+
+def test_dataset_filter_vectorized():
+    schema = {
+        "img": Image((None, None, 3), max_shape=(100, 100, 3)),
+        "cl": ClassLabel(names=["cat", "dog", "horse"]),
+        "score": "float",
+    }
+    ds = Dataset("./data/tests/filtering_vec", shape=(100,), schema=schema, mode="w")
+    for i in range(100):
+        ds["cl", i] = 0 if i % 5 == 0 else 1
+        ds["score", i] = i / 100
+    ds_filtered = ds.filter_vectorized(lambda x: x["cl"] == 0, keys=["cl"])
+    assert ds_filtered.indexes == [5 * i for i in range(20)]
+    ds_filtered = ds.filter_vectorized(
+        lambda x: (x["/cl"] == 1) & (x["/score"] > 0.9), keys=["/cl", "/score"]
+    )
+    assert ds_filtered.indexes == [91, 92, 93, 94, 96, 97, 98, 99]
+    with pytest.raises(KeyError):
+        ds.filter_vectorized(lambda x: x["random"] == 0, keys=["random"])
+    with pytest.raises(ValueError):
+        ds.filter_vectorized(lambda x: x["cl"][:10] == 0, keys=["cl"])
+    ds_filtered = ds.filter_vectorized(lambda x: x["/cl"] == 0)
+    assert ds_filtered.indexes == [5 * i for i in range(20)]
+    ds_filtered = ds.filter_vectorized(
+        lambda x: np.full(100, sorted(x) == ["/cl", "/score"])
+    )
+    assert ds_filtered.indexes == list(range(100))
+
+
+def test_dataset_get_compressor():
+    lz4 = dataset._get_compressor("lz4")
+    assert dataset._get_compressor("LZ4") is lz4
+    assert dataset._get_compressor("Lz4") is lz4
+    assert dataset._get_compressor("ZSTD") is dataset._get_compressor("zstd")
+    assert dataset._get_compressor("Default") == "default"
+    with pytest.raises(ValueError, match="Wrong compressor: Snappy"):
+        dataset._get_compressor("Snappy")
+
+
 def test_dataset_utils():
     with pytest.raises(TypeError):
         slice_split([5.3])
@@ -1107,6 +1364,43 @@ def test_check_label_name():
     assert ds[1:3].compute().tolist() == [{"label": 2}, {"label": 0}]
 
 
+def test_dataset_numpy_nested():
+    schema = {
+        "label": ClassLabel(names=["red", "green", "blue"]),
+        "img": Image((None, None, 3), max_shape=(10, 10, 3)),
+        "nested": {"a": Tensor((2,), "int32"), "b": {"c": "float"}},
+    }
+    ds = Dataset("./data/test/ds_numpy_nested", shape=(3,), mode="w", schema=schema)
+    for i in range(3):
+        ds["label", i] = i
+        ds["img", i] = i * np.ones((i + 1, 2, 3), "uint8")
+        ds["nested/a", i] = np.array([i, 2 * i])
+        ds["nested/b/c", i] = i / 2
+    comp = ds.numpy(label_name=True)
+    assert len(comp) == 3
+    for i in range(3):
+        assert comp[i]["label"] == ["red", "green", "blue"][i]
+        assert (comp[i]["img"] == i * np.ones((i + 1, 2, 3))).all()
+        assert (comp[i]["nested"]["a"] == np.array([i, 2 * i])).all()
+        assert comp[i]["nested"]["b"]["c"] == i / 2
+    assert ds.numpy()[2]["label"] == 2
+    for view in (ds[1:3], ds.filter_vectorized(lambda x: x["/label"] != 1)):
+        comp = view.numpy(label_name=True)
+        for sample, index in zip(comp, view.indexes):
+            assert sample["label"] == ["red", "green", "blue"][index]
+            assert (sample["img"] == index * np.ones((index + 1, 2, 3))).all()
+            assert (sample["nested"]["a"] == np.array([index, 2 * index])).all()
+            assert sample["nested"]["b"]["c"] == index / 2
+    assert ds[1:3].numpy()[0]["label"] == 1
+    structured = ds.numpy(structured=True)
+    assert structured.dtype.names == ("label", "img", "nested/a", "nested/b/c")
+    assert structured["label"].tolist() == [0, 1, 2]
+    assert structured["nested/a"].tolist() == [[0, 0], [1, 2], [2, 4]]
+    assert structured[1]["nested/b/c"] == 0.5
+    assert (structured["img"][2] == 2 * np.ones((3, 2, 3))).all()
+    assert ds.compute(label_name=True, structured=True)["label"][1] == "green"
+
+
 @pytest.mark.skipif(not minio_creds_exist(), reason="requires minio credentials")
 def test_minio_endpoint():
     token = {
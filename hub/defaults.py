@@ -3,4 +3,8 @@ OBJECT_CHUNK = 128
 DEFAULT_COMPRESSOR = "default"
 DEFAULT_MEMORY_CACHE_SIZE = 2 ** 26
 DEFAULT_STORAGE_CACHE_SIZE = 2 ** 28
+DEFAULT_IO_PARALLELISM = 32
+DEFAULT_ITER_PREFETCH = 0
+DEFAULT_PARALLEL_WRITE_SIZE = 2 ** 24
+DEFAULT_FROM_DIRECTORY_READ_AHEAD = 16
 AZURE_HOST_SUFFIX = "blob.core.windows.net"
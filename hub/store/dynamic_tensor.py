@@ -7,6 +7,7 @@ If a copy of the MPL was not distributed with this file, You can obtain one at h
 import collections.abc as abc
 from shutil import Error
 from hub.schema.features import Shape
+import itertools
 import json
 import math
 
@@ -18,6 +19,8 @@ import numcodecs
 from hub.store.nested_store import NestedStore
 from hub.store.shape_detector import ShapeDetector
 from hub.defaults import DEFAULT_COMPRESSOR
+from hub import defaults
+from hub.utils import _get_io_executor, _get_io_parallelism
 
 from hub.exceptions import (
     DynamicTensorNotFoundException,
@@ -27,6 +30,13 @@ from hub.exceptions import (
 from hub.schema.sequence import Sequence
 
 
+def _has_grow_shortcut(tensor: zarr.Array) -> bool:
+    """Whether the zarr.Array internals used to grow it without listing its chunks are there.
+    They are private zarr APIs, present in the pinned zarr 2.6.1
+    """
+    return hasattr(tensor, "_write_op") and hasattr(tensor, "_flush_metadata_nosync")
+
+
 class DynamicTensor:
     """Class for handling dynamic tensor
 
@@ -217,7 +227,84 @@ class DynamicTensor:
 
         slice_ = self._get_slice(slice_, real_shapes)
         value = self.check_value_shape(value, slice_)
-        self._storage_tensor[slice_] = value
+        if not self._setitem_parallel(slice_, value):
+            self._storage_tensor[slice_] = value
+
+    def _setitem_parallel(self, slice_, value) -> bool:
+        """Writes a large value spanning many chunks by compressing the whole chunks in threads,
+        the compressors release the GIL. Returns False if the value has to be written by zarr instead
+        """
+        tensor = self._storage_tensor
+        if (
+            not isinstance(value, np.ndarray)
+            or value.nbytes < defaults.DEFAULT_PARALLEL_WRITE_SIZE
+            or tensor.dtype == object
+            or tensor.order != "C"
+            or tensor.read_only
+            or len(slice_) != tensor.ndim
+            or _get_io_parallelism() <= 1
+        ):
+            return False
+        starts, stops = [], []
+        for sl, dim in zip(slice_, tensor.shape):
+            if isinstance(sl, int):
+                sl = sl + dim if sl < 0 else sl
+                if sl < 0 or sl >= dim:
+                    return False
+                starts.append(sl)
+                stops.append(sl + 1)
+            elif isinstance(sl, slice):
+                start, stop, step = sl.indices(dim)
+                if step != 1 or stop <= start:
+                    return False
+                starts.append(start)
+                stops.append(stop)
+            else:
+                return False
+        box = tuple(stop - start for start, stop in zip(starts, stops))
+        squeezed = tuple(n for n, sl in zip(box, slice_) if not isinstance(sl, int))
+        if value.shape != squeezed:
+            return False
+        value = value.reshape(box)
+
+        full_chunks, partial_chunks = [], []
+        chunk_ranges = [
+            range(start // chunk, (stop - 1) // chunk + 1)
+            for start, stop, chunk in zip(starts, stops, tensor.chunks)
+        ]
+        for chunk_coords in itertools.product(*chunk_ranges):
+            lows = [i * chunk for i, chunk in zip(chunk_coords, tensor.chunks)]
+            highs = [low + chunk for low, chunk in zip(lows, tensor.chunks)]
+            region = [
+                (max(low, start), min(high, stop))
+                for low, high, start, stop in zip(lows, highs, starts, stops)
+            ]
+            value_slice = tuple(
+                slice(low - start, high - start)
+                for (low, high), start in zip(region, starts)
+            )
+            if all(r == (l, h) for r, l, h in zip(region, lows, highs)):
+                full_chunks.append((chunk_coords, value_slice))
+            else:
+                region_slice = tuple(slice(low, high) for low, high in region)
+                partial_chunks.append((region_slice, value_slice))
+        if len(full_chunks) < 2:
+            return False
+
+        def _encode(value_slice):
+            return tensor._encode_chunk(
+                np.ascontiguousarray(value[value_slice], dtype=tensor.dtype)
+            )
+
+        encoded = _get_io_executor().map(
+            _encode, [value_slice for _, value_slice in full_chunks]
+        )
+        # chunks are stored from this thread, as the storage maps are not thread safe
+        for (chunk_coords, _), cdata in zip(full_chunks, encoded):
+            tensor.chunk_store[tensor._chunk_key(chunk_coords)] = cdata
+        for region_slice, value_slice in partial_chunks:
+            tensor[region_slice] = value[value_slice]
+        return True
 
     def check_value_shape(self, value, slice_):
         """Checks if value can be set to the slice"""
@@ -254,6 +341,17 @@ class DynamicTensor:
     def _resize_shape(self, tensor: zarr.Array, size: int) -> None:
         """append first dimension of single array"""
         shape = list(tensor.shape)
+        if size >= shape[0] and _has_grow_shortcut(tensor):
+            # zarr resize looks up every existing chunk to delete those out of the new shape,
+            # growing only the first dimension never deletes any of them
+            shape[0] = size
+
+            def _grow_nosync(new_shape):
+                tensor._shape = new_shape
+                tensor._flush_metadata_nosync()
+
+            tensor._write_op(_grow_nosync, tuple(shape))
+            return
         shape[0] = size
         tensor.resize(*shape)
 
@@ -6,20 +6,7 @@ If a copy of the MPL was not distributed with this file, You can obtain one at h
 
 from collections import OrderedDict
 from collections.abc import MutableMapping
-
-
-class DummyLock:
-    def __init__(self):
-        pass
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, *args):
-        pass
-
-
-Lock = DummyLock
+from threading import Lock
 
 
 class LRUCache(MutableMapping):
@@ -39,6 +26,8 @@ class LRUCache(MutableMapping):
         self._actual_storage = actual_storage
         self._total_cached = 0
         self._cached_items = OrderedDict()
+        # Evicted or flushed items that are being written to actual storage outside of the lock
+        self._writing = {}
         # assert len(self._cache_storage) == 0, "Initially cache storage should be empty"
 
     @property
@@ -55,6 +44,15 @@ class LRUCache(MutableMapping):
         """
         return self._actual_storage
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_mutex"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._mutex = Lock()
+
     def __enter__(self):
         return self
 
@@ -62,9 +60,35 @@ class LRUCache(MutableMapping):
         self.close()
 
     def _flush_dirty(self):
-        for item in self._dirty:
-            self._actual_storage[item] = self._cache_storage[item]
-        self._dirty.clear()
+        # Take the dirty set out under the lock, the write happens after it is released
+        with self._mutex:
+            dirty, self._dirty = self._dirty, set()
+            items = {item: self._cache_storage[item] for item in dirty}
+            self._writing.update(items)
+        self._write_back(items)
+
+    def _write_back(self, items):
+        """Writes items to actual storage, the lock must not be held"""
+        written = set()
+        try:
+            for item, value in items.items():
+                self._actual_storage[item] = value
+                written.add(item)
+        except Exception:
+            with self._mutex:
+                for item, value in items.items():
+                    # Keep the unwritten items dirty unless they got deleted meanwhile
+                    if item in written or self._writing.get(item) is not value:
+                        continue
+                    if item not in self._cached_items:
+                        self._append_cache(item, value)
+                    self._dirty.add(item)
+            raise
+        finally:
+            with self._mutex:
+                for item, value in items.items():
+                    if self._writing.get(item) is value:
+                        del self._writing[item]
 
     def flush(self):
         self._flush_dirty()
@@ -89,21 +113,30 @@ class LRUCache(MutableMapping):
             if key in self._cached_items:
                 self._cached_items.move_to_end(key)
                 return self._cache_storage[key]
-            else:
-                result = self._actual_storage[key]
-                self._free_memory(len(result))
-                self._append_cache(key, result)
-                return result
+            if key in self._writing:
+                return self._writing[key]
+        # Read outside of the lock so that reads of different keys overlap
+        result = self._actual_storage[key]
+        with self._mutex:
+            if key in self._cached_items:
+                # Another thread cached or set it in the meantime
+                self._cached_items.move_to_end(key)
+                return self._cache_storage[key]
+            evicted = self._free_memory(len(result))
+            self._append_cache(key, result)
+        self._write_back(evicted)
+        return result
 
     def __setitem__(self, key, value):
         """ Sets item and puts it in the cache if not there"""
         with self._mutex:
             if key in self._cached_items:
                 self._total_cached -= self._cached_items.pop(key)
-            self._free_memory(len(value))
+            evicted = self._free_memory(len(value))
             self._append_cache(key, value)
             if key not in self._dirty:
                 self._dirty.add(key)
+        self._write_back(evicted)
 
     def __delitem__(self, key):
         deleted_from_cache = False
@@ -113,11 +146,12 @@ class LRUCache(MutableMapping):
                 del self._cache_storage[key]
                 self._dirty.discard(key)
                 deleted_from_cache = True
-            try:
-                del self._actual_storage[key]
-            except KeyError:
-                if not deleted_from_cache:
-                    raise
+            deleted_from_cache |= self._writing.pop(key, None) is not None
+        try:
+            del self._actual_storage[key]
+        except KeyError:
+            if not deleted_from_cache:
+                raise
 
     def __len__(self):
         return len(
@@ -125,22 +159,27 @@ class LRUCache(MutableMapping):
         )  # TODO: In future might need to fix this to return proper len
 
     def __iter__(self):
-        cached_keys = set(self._dirty)
+        with self._mutex:
+            cached_keys = set(self._dirty) | set(self._writing)
         for i in self.actual_storage:
             cached_keys.discard(i)
             yield i
         yield from sorted(cached_keys)
 
     def _free_memory(self, extra_size):
+        """Evicts items until extra_size fits, returns the dirty ones that still have to be written back"""
+        evicted = {}
         while (
             self._total_cached > 0 and extra_size + self._total_cached > self._max_size
         ):
             item, itemsize = self._cached_items.popitem(last=False)
             if item in self._dirty:
-                self._actual_storage[item] = self._cache_storage[item]
+                evicted[item] = self._cache_storage[item]
                 self._dirty.discard(item)
             del self._cache_storage[item]
             self._total_cached -= itemsize
+        self._writing.update(evicted)
+        return evicted
 
     def _append_cache(self, key, value):
         self._total_cached += len(value)
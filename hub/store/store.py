@@ -104,8 +104,10 @@ def read_aws_creds(filepath: str):
     return {section: dict(parser.items(section)) for section in parser.sections()}
 
 
-def _get_storage_map(fs, path):
-    return StorageMapWrapperWithCommit(fs.get_mapper(path, check=False, create=False))
+def _get_storage_map(fs, path, prelisted=None):
+    return StorageMapWrapperWithCommit(
+        fs.get_mapper(path, check=False, create=False), prelisted=prelisted
+    )
 
 
 def get_cache_path(path, cache_folder="~/.activeloop/cache/"):
@@ -128,32 +130,52 @@ def get_cache_path(path, cache_folder="~/.activeloop/cache/"):
     return os.path.expanduser(posixpath.join(cache_folder, path))
 
 
-def get_storage_map(fs, path, memcache=2 ** 26, lock=True, storage_cache=2 ** 28):
-    store = _get_storage_map(fs, path)
+def get_storage_map(
+    fs, path, memcache=2 ** 26, lock=True, storage_cache=2 ** 28, prelisted=None
+):
+    """Creates storage map for the path, optionally wrapped into memory cache
+
+    prelisted: list of full paths returned by fs.find for a directory containing path,
+    used to answer len/iter without listing the path again until it is modified
+    """
+    store = _get_storage_map(fs, path, prelisted=prelisted)
     if memcache and memcache > 0:
         store = LRUCache(zarr.MemoryStore(), store, memcache)
     return store
 
 
 class StorageMapWrapperWithCommit(MutableMapping):
-    def __init__(self, map):
+    def __init__(self, map, prelisted=None):
         self._map = map
         self.root = self._map.root
+        self._keys = None
+        if prelisted is not None:
+            prefix = self.root + "/"
+            self._keys = [
+                path[len(prefix) :] for path in prelisted if path.startswith(prefix)
+            ]
 
     def __getitem__(self, slice_):
         return self._map[slice_]
 
     def __setitem__(self, slice_, value):
+        self._keys = None
         self._map[slice_] = value
 
     def __delitem__(self, slice_):
+        self._keys = None
         del self._map[slice_]
 
     def __len__(self):
+        if self._keys is not None:
+            return len(self._keys)
         return len(self._map)
 
     def __iter__(self):
-        yield from self._map
+        if self._keys is not None:
+            yield from list(self._keys)
+        else:
+            yield from self._map
 
     def flush(self):
         pass
@@ -8,9 +8,12 @@ from hub.exceptions import DynamicTensorShapeException
 import posixpath
 
 import numpy as np
+import pytest
 import fsspec
 from zarr.creation import create
 
+from hub import defaults
+import hub.store.dynamic_tensor as dynamic_tensor
 from hub.store.dynamic_tensor import DynamicTensor
 from hub.store.store import StorageMapWrapperWithCommit
 
@@ -129,6 +132,59 @@ def test_dynamic_tensor_4():
     assert (t[0, 6:8] == np.ones((2, 20, 10), dtype="int32")).all()
 
 
+@pytest.mark.parametrize("shortcut", [True, False])
+def test_dynamic_tensor_resize_shape(shortcut, monkeypatch):
+    if not shortcut:
+        # zarr versions without the private APIs fall back to the public resize
+        monkeypatch.setattr(dynamic_tensor, "_has_grow_shortcut", lambda tensor: False)
+    t = DynamicTensor(
+        create_store("./data/test/test_dynamic_tensor_resize"),
+        mode="w",
+        shape=(5, None),
+        max_shape=(5, 10),
+        dtype="int32",
+        chunks=(1, 10),
+    )
+    t[4] = np.ones((3,), dtype="int32")
+    t.resize_shape(8)
+    assert t.shape == (8, None)
+    t[7] = 2 * np.ones((4,), dtype="int32")
+    assert t[4].tolist() == [1] * 3
+    t.resize_shape(4)
+    t.resize_shape(8)
+    assert t[4].tolist() == [0] * 3
+    t.close()
+
+    t = DynamicTensor(
+        create_store("./data/test/test_dynamic_tensor_resize", overwrite=False),
+        mode="r",
+    )
+    assert tuple(t.shape) == (8, None)
+
+
+def test_dynamic_tensor_setitem_parallel(monkeypatch):
+    monkeypatch.setattr(defaults, "DEFAULT_PARALLEL_WRITE_SIZE", 0)
+    for i, chunks in enumerate([2, (1, 32, 64)]):
+        t = DynamicTensor(
+            create_store(f"./data/test/test_dynamic_tensor_parallel_{i}"),
+            mode="w",
+            shape=(10, 64, 64),
+            max_shape=(10, 64, 64),
+            dtype="int32",
+            chunks=chunks,
+        )
+        expected = np.zeros((10, 64, 64), dtype="int32")
+        value = np.arange(9 * 64 * 64, dtype="int64").reshape((9, 64, 64))
+        t[1:] = value
+        expected[1:] = value
+        t[4, :, 3:] = -np.ones((64, 61), dtype="int32")
+        expected[4, :, 3:] = -1
+        t[6] = 7 * np.ones((64, 64), dtype="int32")
+        expected[6] = 7
+        assert (t[:] == expected).all()
+        t.close()
+
+
 if __name__ == "__main__":
     test_read_and_append_modes()
     # test_chunk_iterator()
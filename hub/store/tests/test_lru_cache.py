@@ -4,6 +4,11 @@ This Source Code Form is subject to the terms of the Mozilla Public License, v.
 If a copy of the MPL was not distributed with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 """
 
+import sys
+import time
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+
 from hub.store.lru_cache import LRUCache
 
 import zarr
@@ -43,5 +48,97 @@ def test_lru_cache():
     cache.commit()
 
 
+def test_lru_cache_threaded():
+    actual = zarr.MemoryStore()
+    for i in range(100):
+        actual[str(i)] = bytes(str(i), "utf-8") * 10
+    cache = LRUCache(zarr.MemoryStore(), actual, 200)
+
+    def read(i):
+        key = str(i % 100)
+        return cache[key] == bytes(key, "utf-8") * 10
+
+    # switch threads often so that unguarded evictions would interleave
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(8) as executor:
+            assert all(executor.map(read, range(20000)))
+    finally:
+        sys.setswitchinterval(interval)
+    assert cache._total_cached <= 200
+    assert cache._total_cached == sum(cache._cached_items.values())
+    assert sorted(cache._cached_items) == sorted(cache.cache_storage)
+
+
+class SlowStore(MutableMapping):
+    """Dict backed store that records the time spent in every read and write"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.data = {}
+        self.calls = []
+
+    def _wait(self, key):
+        start = time.monotonic()
+        time.sleep(self.delay)
+        self.calls.append((key, start, time.monotonic()))
+
+    def __getitem__(self, key):
+        self._wait(key)
+        return self.data[key]
+
+    def __setitem__(self, key, value):
+        self._wait(key)
+        self.data[key] = value
+
+    def __delitem__(self, key):
+        del self.data[key]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+
+def _overlap(calls):
+    (_, start_a, end_a), (_, start_b, end_b) = calls
+    return max(start_a, start_b) < min(end_a, end_b)
+
+
+def test_lru_cache_reads_overlap():
+    actual = SlowStore(0.2)
+    actual.data.update({"a": b"a" * 10, "b": b"b" * 10})
+    cache = LRUCache(zarr.MemoryStore(), actual, 100)
+    with ThreadPoolExecutor(2) as executor:
+        assert list(executor.map(cache.__getitem__, ["a", "b"])) == [
+            b"a" * 10,
+            b"b" * 10,
+        ]
+    assert _overlap(actual.calls)
+
+
+def test_lru_cache_write_back_overlaps_read():
+    actual = SlowStore(0.2)
+    actual.data["b"] = b"b" * 10
+    cache = LRUCache(zarr.MemoryStore(), actual, 10)
+    cache["a"] = b"a" * 10
+    assert "a" not in actual.data
+    with ThreadPoolExecutor(2) as executor:
+        # evicts dirty "a", its write back must not block the read of "b"
+        write = executor.submit(cache.__setitem__, "c", b"c" * 10)
+        time.sleep(0.05)
+        assert cache["a"] == b"a" * 10
+        read = executor.submit(cache.__getitem__, "b")
+        write.result()
+        assert read.result() == b"b" * 10
+    assert actual.data["a"] == b"a" * 10
+    assert _overlap([call for call in actual.calls if call[0] in ("a", "b")])
+
+
 if __name__ == "__main__":
     test_lru_cache()
+    test_lru_cache_threaded()
+    test_lru_cache_reads_overlap()
+    test_lru_cache_write_back_overlaps_read()
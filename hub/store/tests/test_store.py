@@ -4,7 +4,9 @@ This Source Code Form is subject to the terms of the Mozilla Public License, v.
 If a copy of the MPL was not distributed with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 """
 
-from hub.store.store import get_cache_path
+import fsspec
+
+from hub.store.store import get_cache_path, get_storage_map
 
 
 def test_get_cache_path():
@@ -18,5 +20,23 @@ def test_get_cache_path():
     assert "./cache/test\\testdb" == get_cache_path("C:\\test\\testdb", cache_folder)
 
 
+def test_storage_map_prelisted():
+    fs = fsspec.filesystem("file")
+    if fs.exists("./data/test/prelisted"):
+        fs.rm("./data/test/prelisted", recursive=True)
+    fs.makedirs("./data/test/prelisted/a")
+    fs.makedirs("./data/test/prelisted/b")
+    fs.pipe("./data/test/prelisted/a/0", b"0")
+    fs.pipe("./data/test/prelisted/b/0", b"0")
+    prelisted = fs.find("./data/test/prelisted")
+    store = get_storage_map(fs, "./data/test/prelisted/a", 0, prelisted=prelisted)
+    fs.pipe("./data/test/prelisted/a/1", b"1")
+    assert list(store) == ["0"]
+    store["2"] = b"2"
+    assert sorted(store) == ["0", "1", "2"]
+    assert len(store) == 3
+
+
 if __name__ == "__main__":
     test_get_cache_path()
+    test_storage_map_prelisted()
@@ -5,7 +5,7 @@ If a copy of the MPL was not distributed with this file, You can obtain one at h
 """
 
 from hub.utils import *
-from hub.utils import _flatten
+from hub.utils import _flatten, _json_dumps, _json_loads
 
 
 def test_flatten_array():
@@ -14,6 +14,18 @@ def test_flatten_array():
     assert flatten_list == expected_list
 
 
+def test_json_dumps_loads():
+    meta = {"shape": (10,), "meta_info": {"a": [1, 2.5, None], 5: "b"}, "name": None}
+    buf = _json_dumps(meta)
+    assert isinstance(buf, bytes)
+    assert _json_loads(buf) == {
+        "shape": [10],
+        "meta_info": {"a": [1, 2.5, None], "5": "b"},
+        "name": None,
+    }
+    assert _json_loads(buf.decode("utf-8")) == _json_loads(buf)
+
+
 def test_pytorch_loaded():
     result = pytorch_loaded()
     if result:
@@ -5,14 +5,22 @@ If a copy of the MPL was not distributed with this file, You can obtain one at h
 """
 
 from math import gcd
+import json
+import os
 import time
 from collections import abc
+from concurrent.futures import ThreadPoolExecutor
 
 from numpy.lib.arraysetops import isin
 
 from hub.exceptions import ShapeLengthException
 from hub import defaults
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def _flatten(list_):
     """
@@ -177,6 +185,42 @@ def _tuple_product(tuple_):
     return res
 
 
+def _json_dumps(obj) -> bytes:
+    """Serializes obj into utf-8 encoded json, using orjson if it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(buf):
+    """Deserializes json from bytes or str, using orjson if it is installed"""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+_io_executor = None
+_io_executor_pid = None
+
+
+def _get_io_parallelism():
+    return int(
+        os.environ.get("HUB_IO_PARALLELISM", defaults.DEFAULT_IO_PARALLELISM)
+    )
+
+
+def _get_io_executor():
+    """Thread pool shared by all datasets for IO bound work: flushing and loading tensors,
+    compressing large writes and reading files in from_directory, recreated in forked processes.
+    Its size is set with the HUB_IO_PARALLELISM environment variable, 1 disables it
+    """
+    global _io_executor, _io_executor_pid
+    if _io_executor is None or _io_executor_pid != os.getpid():
+        _io_executor = ThreadPoolExecutor(max_workers=_get_io_parallelism())
+        _io_executor_pid = os.getpid()
+    return _io_executor
+
+
 class Timer:
     def __init__(self, text):
         self._text = text